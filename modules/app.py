@@ -1,10 +1,16 @@
 import sys
+import signal
 import asyncio
 from typing import Optional
 
 from modules.bots import TelegramBot
 from modules.schedulers import GoldScheduler
-from modules.configs import get_settings, get_logger
+from modules.configs import get_settings, get_logger, reload_settings
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
 
 
 class GMinerApp:
@@ -14,7 +20,8 @@ class GMinerApp:
         self.logger = get_logger("GMiner")
         self._settings = None
 
-        self.bot_task: Optional[asyncio.Task] = None
+        # Task running `run()`, so `stop()` can end it from elsewhere
+        self._run_task: Optional[asyncio.Task] = None
 
         self.telegram_bot: Optional[TelegramBot] = None
 
@@ -31,14 +38,14 @@ class GMinerApp:
         """Initialize Telegram bot instance."""
         self.logger.info("Initializing Telegram Bot...")
 
-        if not self.settings["TELEGRAM_TOKEN"]:
+        if not self.settings.TELEGRAM_TOKEN:
             self.logger.error("TELEGRAM_TOKEN is not set in .env file.")
             raise ValueError("TELEGRAM_TOKEN is not set in .env file.")
 
-        self.telegram_bot = TelegramBot(
-            token=self.settings["TELEGRAM_TOKEN"],
-            proxy=self.settings["TELEGRAM_PROXY_URL"],
-            admin_ids=self.settings["ADMIN_CHAT_IDS"],
+        self.telegram_bot = TelegramBot.instance(
+            token=self.settings.TELEGRAM_TOKEN,
+            proxy=self.settings.TELEGRAM_PROXY_URL,
+            admin_ids=self.settings.ADMIN_CHAT_IDS,
         )
 
         self.logger.info("Telegram Bot initialized.")
@@ -50,11 +57,13 @@ class GMinerApp:
 
         self.logger.info("Initializing Scheduler...")
 
-        if not self.settings["TELEGRAM_CHANNEL_ID"]:
+        if not self.settings.TELEGRAM_CHANNEL_ID:
             self.logger.error("TELEGRAM_CHANNEL_ID is not set in .env file.")
             raise ValueError("TELEGRAM_CHANNEL_ID is not set in .env file.")
 
-        self.scheduler = GoldScheduler(telegram_bot=self.telegram_bot)
+        self.scheduler = GoldScheduler(
+            telegram_bot=self.telegram_bot, settings=self.settings
+        )
 
         self.logger.info("Scheduler initialized.")
 
@@ -63,14 +72,17 @@ class GMinerApp:
         if not self.telegram_bot or not self.scheduler:
             raise RuntimeError("Bot and scheduler must be initialized before running.")
 
-        try:
-            self.logger.info("Starting scheduler...")
-            self.scheduler.start()
+        self._run_task = asyncio.current_task()
 
-            self.logger.info("Starting Telegram bot polling...")
-            self.bot_task = asyncio.create_task(self.telegram_bot.run())
+        try:
+            # Both halves live in one task group: if either fails or the group
+            # is cancelled, the other one is cancelled and awaited too.
+            async with asyncio.TaskGroup() as tg:
+                self.logger.info("Starting scheduler...")
+                tg.create_task(self._run_scheduler(), name="scheduler")
 
-            await self.bot_task
+                self.logger.info("Starting Telegram bot polling...")
+                tg.create_task(self.telegram_bot.run(), name="telegram-bot")
 
         except asyncio.CancelledError:
             self.logger.warning("Bot and scheduler tasks cancelled.")
@@ -88,22 +100,23 @@ class GMinerApp:
         if self.scheduler:
             self.logger.info("Stopping scheduler...")
             try:
-                self.scheduler.stop()
+                await self.scheduler.stop()
             except Exception as e:
                 self.logger.error(f"Error stopping scheduler: {e}")
             self.scheduler = None
 
-        # 2. Cancel bot task first to stop polling gracefully
-        if self.bot_task and not self.bot_task.done():
-            self.logger.info("Cancelling bot task...")
-            self.bot_task.cancel()
+        # 2. Cancel the running task group to stop polling gracefully
+        run_task = self._run_task
+        self._run_task = None
+        if run_task and run_task is not asyncio.current_task() and not run_task.done():
+            self.logger.info("Cancelling running tasks...")
+            run_task.cancel()
             try:
-                await self.bot_task
+                await run_task
             except asyncio.CancelledError:
-                self.logger.info("Bot task cancelled successfully.")
+                self.logger.info("Running tasks cancelled successfully.")
             except Exception as e:
-                self.logger.error(f"Error while stopping bot task: {e}")
-            self.bot_task = None
+                self.logger.error(f"Error while stopping running tasks: {e}")
 
         # 3. Stop Telegram bot instance safely
         if self.telegram_bot:
@@ -116,11 +129,25 @@ class GMinerApp:
                 self.logger.error(f"Error stopping Telegram bot: {e}")
             self.telegram_bot = None
 
+    async def _run_scheduler(self):
+        """
+        Run the scheduler for as long as this task lives.
+
+        Its loop is awaited here, so an error in it fails the task group
+        instead of stopping the scheduler silently.
+        """
+        scheduler = self.scheduler
+        try:
+            await scheduler.start()  # type: ignore
+        finally:
+            await scheduler.stop()  # type: ignore
+
     def reload_config(self):
         """Reload environment config at runtime."""
         self.logger.info("Reloading configuration...")
+        # Only invalidate here, the .env file is read again on next access
+        reload_settings()
         self._settings = None
-        self._settings = get_settings()
         self.logger.info("Configuration reloaded.")
 
     async def restart(self):
@@ -131,17 +158,40 @@ class GMinerApp:
         self.initialize_scheduler()
         await self.run()
 
+    async def _main(self):
+        """Run the application and always clean up on the same event loop."""
+        # SIGTERM (e.g. from systemd or docker stop) shuts down like Ctrl+C does
+        loop = asyncio.get_running_loop()
+        main_task = asyncio.current_task()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, main_task.cancel)  # type: ignore
+            except NotImplementedError:  # Windows has no loop signal handlers
+                pass
+
+        try:
+            await self.run()
+        except asyncio.CancelledError:
+            self.logger.warning("Shutdown signal received, stopping GMiner...")
+        finally:
+            await self.stop()
+
     def start(self):
         """Entry point to run the application."""
         self.logger.info("Starting GMiner application...")
+
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            self.logger.info("Using uvloop event loop.")
+
         try:
             self.initialize_bot()
             self.initialize_scheduler()
-            asyncio.run(self.run())
+            asyncio.run(self._main())
 
         except KeyboardInterrupt:
+            # Cleanup already ran inside _main before the loop was closed
             self.logger.warning("Application stopped by user (KeyboardInterrupt).")
-            asyncio.run(self.stop())
 
         except Exception as e:
             self.logger.error(f"Fatal error in GMiner: {e}", exc_info=True)
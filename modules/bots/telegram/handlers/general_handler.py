@@ -1,8 +1,52 @@
-from logging import Logger
+from typing import ClassVar, Final
+from logging import INFO
 from telegram import Update
 from telegram.ext import ContextTypes, Application, CommandHandler
 
 from ..wrappers import admin_only
+from modules.configs import get_settings, get_logger
+
+logger = get_logger("TelegramBot")
+
+# Reply bodies are built once at import, handlers only fill in the dynamic parts
+_START_TEMPLATE: Final[str] = (
+    "👋 <b>Greetings, {name}!</b>\n\n"
+    "🤖 System operational.\n\n"
+    "<b>Available Commands:</b>\n"
+    "• /start - Show this message\n"
+    "• /settings - Manage bot settings\n"
+    "• /help - Get help information\n"
+    "• /status - Check system status"
+)
+
+_HELP_MESSAGE: Final[str] = (
+    "📖 <b>Help Information</b>\n\n"
+    "<b>Settings Management:</b>\n"
+    "• /status - Check system status\n"
+    "• /settings - Open settings menu\n"
+    "• /reload - Reload settings from .env file\n\n"
+    "<b>What you can configure:</b>\n"
+    "• 🕒 Scheduler settings (timing, intervals)\n"
+    "• 💰 Zarbaha scraper settings (rates, timeouts)\n\n"
+    "<b>How to edit:</b>\n"
+    "1. Use /settings to open the menu\n"
+    "2. Select a category\n"
+    "3. Choose a setting to edit\n"
+    "4. Send the new value\n\n"
+    "All changes are saved to the .env file automatically."
+)
+
+_STATUS_TEMPLATE: Final[str] = (
+    "Scheduler:\n"
+    "<b>Scheduler:</b> {scheduler_state} {status_icon}\n"
+    "<b>Interval:</b> {interval} minutes\n"
+    "<b>Timezone:</b> {time_zone}\n"
+    "<b>Working Hours:</b> {start_time} - {end_time}\n\n"
+    "<b>Telegram:</b>\n"
+    "👥 <b>Admins:</b> {admins}\n"
+    "📡 <b>Channel:</b> {channel_id}\n\n"
+    "Use /settings to modify configuration."
+)
 
 
 class GeneralHandlers:
@@ -10,33 +54,30 @@ class GeneralHandlers:
     Handles general user interactions like /start, /help, and echoing.
     """
 
-    def __init__(self, logger: Logger):
-        self.logger = logger
+    # (command, handler method name) pairs registered by `register`
+    _COMMANDS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("start", "start"),
+        ("help", "help_command"),
+        ("status", "status_command"),
+    )
 
     @admin_only
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         Handles the /start command.
         """
-        user = update.effective_user
-        name = user.name  # type: ignore
-
-        self.logger.info(f"Handler Triggered: /start by {name}")
-
-        message = (
-            f"👋 <b>Greetings, {name}!</b>\n\n"
-            "🤖 System operational.\n\n"
-            "<b>Available Commands:</b>\n"
-            "• /start - Show this message\n"
-            "• /settings - Manage bot settings\n"
-            "• /help - Get help information\n"
-            "• /status - Check system status"
-        )
+        msg = update.message
+        name = update.effective_user.name  # type: ignore
+
+        if logger.isEnabledFor(INFO):
+            logger.info("Handler Triggered: /start by %s", name)
 
-        await update.message.reply_text(  # type: ignore
+        message = _START_TEMPLATE.format(name=name)
+
+        await msg.reply_text(  # type: ignore
             message,
             parse_mode="HTML",
-            reply_to_message_id=update.message.message_id,  # type: ignore
+            reply_to_message_id=msg.message_id,  # type: ignore
         )
 
     @admin_only
@@ -44,30 +85,14 @@ class GeneralHandlers:
         """
         Handles the /help command.
         """
-        user = update.effective_user
-        self.logger.info(f"Handler Triggered: /help by {user.name}")  # type: ignore
-
-        message = (
-            "📖 <b>Help Information</b>\n\n"
-            "<b>Settings Management:</b>\n"
-            "• /status - Check system status\n"
-            "• /settings - Open settings menu\n"
-            "• /reload - Reload settings from .env file\n\n"
-            "<b>What you can configure:</b>\n"
-            "• 🕒 Scheduler settings (timing, intervals)\n"
-            "• 💰 Zarbaha scraper settings (rates, timeouts)\n\n"
-            "<b>How to edit:</b>\n"
-            "1. Use /settings to open the menu\n"
-            "2. Select a category\n"
-            "3. Choose a setting to edit\n"
-            "4. Send the new value\n\n"
-            "All changes are saved to the .env file automatically."
-        )
+        msg = update.message
+        if logger.isEnabledFor(INFO):
+            logger.info("Handler Triggered: /help by %s", update.effective_user.name)  # type: ignore
 
-        await update.message.reply_text(  # type: ignore
-            message,
+        await msg.reply_text(  # type: ignore
+            _HELP_MESSAGE,
             parse_mode="HTML",
-            reply_to_message_id=update.message.message_id,  # type: ignore
+            reply_to_message_id=msg.message_id,  # type: ignore
         )
 
     @admin_only
@@ -75,38 +100,37 @@ class GeneralHandlers:
         """
         Handles the /status command - shows system status.
         """
-        from modules.configs import get_settings
-
-        user = update.effective_user
-        self.logger.info(f"Handler Triggered: /status by {user.name}")  # type: ignore
+        msg = update.message
+        if logger.isEnabledFor(INFO):
+            logger.info("Handler Triggered: /status by %s", update.effective_user.name)  # type: ignore
 
         settings = get_settings()
 
-        status_icon = "🟢" if settings["SCHEDULER_ENABLED"] else "🔴"
-
-        message = (
-            f"Scheduler:\n"
-            f"<b>Scheduler:</b> {'Enabled' if settings['SCHEDULER_ENABLED'] else 'Disabled'} {status_icon}\n"
-            f"<b>Interval:</b> {settings['SCHEDULER_INTERVAL_MINUTES']} minutes\n"
-            f"<b>Timezone:</b> {settings['SCHEDULER_TIME_ZONE']}\n"
-            f"<b>Working Hours:</b> {settings['SCHEDULER_START_TIME']} - {settings['SCHEDULER_END_TIME']}\n\n"
-            f"<b>Telegram:</b>\n"
-            f"👥 <b>Admins:</b> {len(settings['ADMIN_CHAT_IDS'])}\n"
-            f"📡 <b>Channel:</b> {settings['TELEGRAM_CHANNEL_ID']}\n\n"
-            f"Use /settings to modify configuration."
+        message = _STATUS_TEMPLATE.format(
+            scheduler_state="Enabled" if settings.SCHEDULER_ENABLED else "Disabled",
+            status_icon="🟢" if settings.SCHEDULER_ENABLED else "🔴",
+            interval=settings.SCHEDULER_INTERVAL_MINUTES,
+            time_zone=settings.SCHEDULER_TIME_ZONE,
+            start_time=settings.SCHEDULER_START_TIME,
+            end_time=settings.SCHEDULER_END_TIME,
+            admins=len(settings.ADMIN_CHAT_IDS),
+            channel_id=settings.TELEGRAM_CHANNEL_ID,
         )
 
-        await update.message.reply_text(  # type: ignore
+        await msg.reply_text(  # type: ignore
             message,
             parse_mode="HTML",
-            reply_to_message_id=update.message.message_id,  # type: ignore
+            reply_to_message_id=msg.message_id,  # type: ignore
         )
 
     def register(self, app: Application):
         """
         Attaches these handlers to the main application.
         """
-        app.add_handler(CommandHandler("start", self.start))
-        app.add_handler(CommandHandler("help", self.help_command))
-        app.add_handler(CommandHandler("status", self.status_command))
-        self.logger.info("GeneralHandlers registered successfully.")
+        app.add_handlers(
+            [
+                CommandHandler(cmd, getattr(self, method))
+                for cmd, method in self._COMMANDS
+            ]
+        )
+        logger.info("GeneralHandlers registered successfully.")
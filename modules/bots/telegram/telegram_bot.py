@@ -1,14 +1,50 @@
 import asyncio
-from typing import Optional
-from telegram.ext import Application
+import inspect
+import httpx
+from datetime import timedelta
+from typing import Awaitable, Callable, ClassVar, Iterable, Optional
+from telegram.ext import AIORateLimiter, Application
+from telegram.request import HTTPXRequest
+from telegram.error import BadRequest, NetworkError, RetryAfter
 
 from .handlers import GeneralHandlers
 from modules.configs import get_logger
 
+# Called once a message is delivered, may return an awaitable to run async work
+OnSent = Callable[[], Optional[Awaitable[None]]]
+
 
 class TelegramBot:
+    # Long-poll wait passed to getUpdates. PTB adds it on top of the read timeout,
+    # so an idle bot issues one request per POLL_TIMEOUT seconds.
+    POLL_TIMEOUT = 30
+
+    # Telegram allows about 30 messages per second per bot, keep bursts below it
+    NOTIFY_CONCURRENCY = 29
+
+    # Maximum number of channel messages waiting to be sent
+    SEND_QUEUE_SIZE = 64
+
+    # Seconds to wait for queued messages to be sent on shutdown
+    SEND_DRAIN_TIMEOUT = 10
+
+    # Attempts for a message before it is dropped
+    SEND_ATTEMPTS = 4
+
+    # Seconds to wait after the first network error, doubled on every retry
+    SEND_BACKOFF = 1
+
+    # Extra seconds on top of Telegram's retry_after, so the retry lands after it
+    RETRY_AFTER_MARGIN = 0.5
+
+    # Process-wide bot returned by instance(), one Application and HTTP pool per process
+    _instance: ClassVar[Optional["TelegramBot"]] = None
+
     def __init__(
-        self, token: str, proxy: Optional[str] = None, admin_ids: Optional[set] = None
+        self,
+        token: str,
+        proxy: Optional[str] = None,
+        admin_ids: Optional[Iterable[int]] = None,
     ):
         # 1. Setup Logger
         self.logger = get_logger("TelegramBot")
@@ -16,16 +52,40 @@ class TelegramBot:
         # 2. Load Configs
         self.token = token
         self.proxy = proxy
-        self.admin_ids = admin_ids or set()
+        # Sorted tuple: cheap to iterate and notifies admins in a stable order
+        self.admin_ids: tuple[int, ...] = tuple(sorted(admin_ids or ()))
 
         # 3. Build Application
         builder = self.build()
         self.app = builder.build()
         self.bot = self.app.bot
 
-        # 4. Initialize Logic Classes
-        # Inject the logger into handlers so they use the same system
-        self.general_handlers = GeneralHandlers(self.logger)
+        # 4. Outgoing channel messages are sent by a single consumer task
+        self._send_queue: asyncio.Queue = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._sender_task: Optional[asyncio.Task] = None
+        self._notify_limit = asyncio.Semaphore(self.NOTIFY_CONCURRENCY)
+
+        # Set by stop() to end the polling loop in run()
+        self._stop_event = asyncio.Event()
+
+        # 5. Initialize Logic Classes
+        self.general_handlers = GeneralHandlers()
+
+    @classmethod
+    def instance(
+        cls,
+        token: str,
+        proxy: Optional[str] = None,
+        admin_ids: Optional[Iterable[int]] = None,
+    ) -> "TelegramBot":
+        """
+        Return the shared bot, creating it on the first call.
+        """
+        if cls._instance is None:
+            cls._instance = cls(token=token, proxy=proxy, admin_ids=admin_ids)
+        elif cls._instance.token != token:
+            raise ValueError("TelegramBot is already running with a different token.")
+        return cls._instance
 
     async def run(self):
         """
@@ -42,14 +102,15 @@ class TelegramBot:
             # Initialize and start polling
             await self.app.initialize()
             await self.app.start()
-            await self.app.updater.start_polling()  # type: ignore
+            self._sender_task = asyncio.create_task(self._sender_loop())
+            await self.app.updater.start_polling(timeout=self.POLL_TIMEOUT)  # type: ignore
 
             try:
-                await asyncio.Event().wait()
+                await self._stop_event.wait()
             finally:
-                await self.app.updater.stop()  # type: ignore
-                await self.app.stop()
-                await self.app.shutdown()
+                # When stop() woke us it is already shutting down, don't repeat it
+                if not self._stop_event.is_set():
+                    await self.stop()
 
         except Exception as e:
             self.logger.error(f"Error running Telegram Bot: {e}")
@@ -60,7 +121,16 @@ class TelegramBot:
         if not self.app:
             return
 
+        self._stop_event.set()
+
         try:
+            # Stop polling first so no new updates arrive while shutting down
+            if self.app.updater and self.app.updater.running:
+                self.logger.info("Stopping Telegram bot polling...")
+                await self.app.updater.stop()
+
+            await self._stop_sender()
+
             if self.app.running:
                 self.logger.info("Stopping Telegram bot...")
                 await self.app.stop()
@@ -70,6 +140,10 @@ class TelegramBot:
             self.logger.info("Telegram bot stop cancelled due to task cancellation.")
         except Exception as e:
             self.logger.error(f"Error stopping Telegram Bot: {e}")
+        finally:
+            # A stopped Application can't be restarted, let instance() build a new one
+            if TelegramBot._instance is self:
+                TelegramBot._instance = None
 
     def build(self):
         """
@@ -78,18 +152,50 @@ class TelegramBot:
         try:
             builder = Application.builder().token(self.token)
 
-            # Configure proxy if TELEGRAM_PROXY_URL is set
+            # Separate HTTP clients: the long-poll getUpdates call holds a connection
+            # open, so it gets its own small pool and never starves outgoing sends.
+            outbound = HTTPXRequest(
+                connection_pool_size=32,
+                # HTTP/2 multiplexes concurrent sends over one TLS connection
+                http_version="2",
+                connect_timeout=10,
+                read_timeout=10,
+                write_timeout=10,
+                pool_timeout=10,
+                proxy=self.proxy,
+                # httpx drops idle connections after 5s by default, keep a few
+                # open longer so consecutive sends skip the TLS handshake
+                httpx_kwargs={
+                    "limits": httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=8,
+                        keepalive_expiry=60,
+                    )
+                },
+            )
+            polling = HTTPXRequest(
+                connection_pool_size=4,
+                connect_timeout=10,
+                read_timeout=10,
+                write_timeout=10,
+                pool_timeout=10,
+                proxy=self.proxy,
+            )
+            builder.request(outbound).get_updates_request(polling)
+
+            # Throttle outgoing calls to Telegram's limits instead of retrying on 429
+            builder.rate_limiter(
+                AIORateLimiter(
+                    overall_max_rate=29,
+                    overall_time_period=1,
+                    group_max_rate=20,
+                    group_time_period=60,
+                )
+            )
+
             if self.proxy:
-                builder.proxy(self.proxy)
-                builder.get_updates_proxy(self.proxy)
                 self.logger.info("Using proxy for Telegram bot.")
 
-            # Set timeouts
-            builder.get_updates_connect_timeout(10)
-            builder.get_updates_read_timeout(10)
-            builder.get_updates_write_timeout(10)
-            builder.get_updates_pool_timeout(10)
-
             return builder
 
         except Exception as e:
@@ -103,39 +209,178 @@ class TelegramBot:
         Args:
             text (str): The message content to send.
         """
-        try:
-            # 1. Access the Bot object from the Application
-            bot = self.app.bot
 
-            # 2. Call the send_message method
-            for chat_id in self.admin_ids:
-                chat = await bot.get_chat(chat_id)
-                if chat:
-                    await chat.send_message(text=text, parse_mode=parse_mode)
+        async def send(chat_id):
+            async with self._notify_limit:
+                await self._send_with_retry(chat_id, text, parse_mode)
 
-            self.logger.info(f"Successfully notified admins")
+        results = await asyncio.gather(
+            *(send(chat_id) for chat_id in self.admin_ids), return_exceptions=True
+        )
 
-        except Exception as e:
-            self.logger.error(f"Error notifying admins: {e}")
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.logger.error(
+                f"Error notifying {len(errors)}/{len(results)} admins: {errors[0]}"
+            )
+        else:
+            self.logger.info(f"Successfully notified admins")
 
     async def send_channel_message(
-        self, channel_id: str, text: str, parse_mode: str = "HTML"
+        self,
+        channel_id: str,
+        text: str,
+        parse_mode: str = "HTML",
+        on_sent: Optional[OnSent] = None,
     ):
         """
-        Sends a message to a specific Telegram channel.
+        Queues a message for a specific Telegram channel.
+
+        While the bot is running the message is sent by the sender task, so the
+        caller never waits on Telegram. Otherwise it is sent right away.
 
         Args:
             channel_id (str): The ID of the channel (e.g., @channelusername or -100123456789).
             text (str): The message content to send.
+            on_sent (Callable): Called once the message is delivered, never
+                when it fails or is dropped. An awaitable it returns is awaited,
+                so blocking work belongs in an executor. Its errors are logged.
         """
+        if self._sender_task is None or self._sender_task.done():
+            await self._send(channel_id, text, parse_mode, on_sent)
+            return
+
         try:
-            # 1. Access the Bot object from the Application
-            bot = self.app.bot
+            self._send_queue.put_nowait((channel_id, text, parse_mode, on_sent))
+        except asyncio.QueueFull:
+            self.logger.warning(
+                f"Send queue is full, dropping message to channel {channel_id}"
+            )
 
-            # 2. Call the send_message method
-            await bot.send_message(chat_id=channel_id, text=text, parse_mode=parse_mode)
+    async def _send(
+        self,
+        channel_id: str,
+        text: str,
+        parse_mode: str,
+        on_sent: Optional[OnSent] = None,
+    ):
+        """Send a single message to a channel and log the outcome."""
+        try:
+            await self._send_with_retry(channel_id, text, parse_mode)
 
             self.logger.info(f"Successfully sent message to channel: {channel_id}")
 
         except Exception as e:
             self.logger.error(f"Error sending message to channel {channel_id}: {e}")
+            return
+
+        if on_sent is not None:
+            try:
+                result = on_sent()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                # Never let a callback end the sender task
+                self.logger.error(f"Error in on_sent callback: {e}")
+
+    async def _send_with_retry(self, chat_id: int | str, text: str, parse_mode: str):
+        """
+        Send a message, retrying up to SEND_ATTEMPTS times.
+
+        Flood control waits for the `retry_after` Telegram asks for, network
+        errors back off exponentially. Other errors, and the last one when
+        giving up, are raised.
+        """
+        for attempt in range(1, self.SEND_ATTEMPTS + 1):
+            try:
+                return await self.bot.send_message(
+                    chat_id=chat_id, text=text, parse_mode=parse_mode
+                )
+
+            except BadRequest:
+                # A NetworkError subclass, but resending the same request won't help
+                raise
+
+            except (RetryAfter, NetworkError) as e:
+                if attempt == self.SEND_ATTEMPTS:
+                    raise
+
+                if isinstance(e, RetryAfter):
+                    delay = e.retry_after
+                    if isinstance(delay, timedelta):
+                        delay = delay.total_seconds()
+                    delay += self.RETRY_AFTER_MARGIN
+                else:
+                    delay = self.SEND_BACKOFF * 2 ** (attempt - 1)
+
+                self.logger.warning(
+                    f"Retrying message to {chat_id} in {delay}s "
+                    f"({attempt}/{self.SEND_ATTEMPTS}): {e}"
+                )
+                await asyncio.sleep(delay)
+
+    async def _sender_loop(self):
+        """Consume queued channel messages one at a time."""
+        while True:
+            channel_id, text, parse_mode, on_sent = await self._send_queue.get()
+            try:
+                await self._send(channel_id, text, parse_mode, on_sent)
+            except Exception as e:
+                # Keep draining the queue whatever happened to this message
+                self.logger.error(f"Error in sender loop: {e}")
+            finally:
+                self._send_queue.task_done()
+
+    async def _stop_sender(self):
+        """Drain queued channel messages and stop the sender task."""
+        if self._sender_task is None:
+            return
+
+        try:
+            await asyncio.wait_for(
+                self._send_queue.join(), timeout=self.SEND_DRAIN_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"Dropping {self._send_queue.qsize()} unsent channel messages."
+            )
+
+        self._sender_task.cancel()
+        try:
+            await self._sender_task
+        except asyncio.CancelledError:
+            pass
+        self._sender_task = None
+
+    async def send_channel_messages(
+        self, channel_id: str, texts: list[str], parse_mode: str = "HTML"
+    ):
+        """
+        Sends several messages to a Telegram channel concurrently.
+
+        All requests go through the bot's shared HTTP client, so they reuse
+        its pooled connections instead of waiting on each other. Each one is
+        retried like any other message, at most NOTIFY_CONCURRENCY at a time.
+
+        Args:
+            channel_id (str): The ID of the channel (e.g., @channelusername or -100123456789).
+            texts (list[str]): The message contents to send.
+        """
+
+        async def send(text):
+            async with self._notify_limit:
+                await self._send_with_retry(channel_id, text, parse_mode)
+
+        results = await asyncio.gather(
+            *(send(text) for text in texts), return_exceptions=True
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.logger.error(
+                f"Failed to send {len(errors)}/{len(texts)} messages to channel {channel_id}: {errors[0]}"
+            )
+        else:
+            self.logger.info(
+                f"Successfully sent {len(texts)} messages to channel: {channel_id}"
+            )
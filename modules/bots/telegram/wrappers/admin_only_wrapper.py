@@ -3,10 +3,9 @@ from telegram.ext import ContextTypes
 
 from modules.configs import get_settings, get_logger
 
-
 logger = get_logger("TelegramBot")
 settings = get_settings()
-ADMIN_CHAT_IDS = settings["ADMIN_CHAT_IDS"]
+ADMIN_CHAT_IDS = settings.ADMIN_CHAT_IDS
 
 
 def admin_only(func):
@@ -15,19 +14,24 @@ def admin_only(func):
     Replies with a warning if unauthorized.
     """
 
+    # The admin id set is bound as a default argument so it's a local lookup per call
     async def wrapped(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        *args,
+        _allowed=ADMIN_CHAT_IDS,
+        **kwargs,
     ):
         user = update.effective_user
 
-        if not user or str(user.id) not in ADMIN_CHAT_IDS:
-            if update.message:
+        if not user or user.id not in _allowed:
+            msg = update.message
+            if msg:
                 logger.warning(
                     f"Unauthorized user {user.name} ({user.id}) tried to execute a protected handler."  # type: ignore
                 )
-                await update.message.reply_text(
-                    "⛔ You are not allowed to use this bot."
-                )
+                await msg.reply_text("⛔ You are not allowed to use this bot.")
             return  # Stop execution for unauthorized users
         return await func(self, update, context, *args, **kwargs)
 
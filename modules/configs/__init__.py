@@ -1,3 +1,3 @@
 from .celery import celery_app
 from .logger import get_logger
-from .settings import get_settings
+from .settings import Settings, get_settings, reload_settings, is_settings_stale
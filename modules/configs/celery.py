@@ -5,20 +5,24 @@ from .settings import get_settings
 
 settings_data = get_settings()
 
-SCHEDULER_INTERVAL_MINUTES = int(settings_data["SCHEDULER_INTERVAL_MINUTES"])
+SCHEDULER_INTERVAL_MINUTES = int(settings_data.SCHEDULER_INTERVAL_MINUTES)
 
 celery_app = Celery(
-    settings_data["PROJECT_NAME"],
-    broker=settings_data["BROKER_URL"],
-    backend=settings_data["RESULT_BACKEND"],
+    settings_data.PROJECT_NAME,
+    broker=settings_data.BROKER_URL,
+    backend=settings_data.RESULT_BACKEND,
 )
 
+# msgpack is more compact than JSON on the broker, JSON is still accepted
+# so messages queued before the switch can be consumed
 celery_app.conf.update(
-    task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
+    task_serializer="msgpack",
+    result_serializer="msgpack",
+    accept_content=["msgpack", "json"],
     timezone="UTC",
     enable_utc=True,
+    # Take one tick at a time, ticks waiting behind a slow one stay on the broker
+    worker_prefetch_multiplier=1,
 )
 
 
@@ -32,5 +36,8 @@ celery_app.conf.beat_schedule = {
     f"run-gold-every-{SCHEDULER_INTERVAL_MINUTES}-minutes": {
         "task": "modules.tasks.gold_tasks.fetch_and_send",
         "schedule": crontab(minute=f"*/{SCHEDULER_INTERVAL_MINUTES}"),
+        # A tick still queued when the next one is due is dropped, so ticks
+        # that piled up behind a slow worker don't each scrape and send
+        "options": {"expires": SCHEDULER_INTERVAL_MINUTES * 60},
     },
 }
@@ -1,18 +1,24 @@
 import os
-import colorlog
+import sys
 import logging
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 
 from .settings import get_settings
 
 settings_data = get_settings()
 
-BASE_DIR = settings_data["BASE_DIR"]
+BASE_DIR = settings_data.BASE_DIR
+LOG_LEVEL = settings_data.LOG_LEVEL
+
+# Colors only matter on a terminal, daemonized workers skip colorlog entirely
+USE_COLORS = sys.stderr.isatty()
 
 LOG_DIR = BASE_DIR / "logs"
 os.makedirs(LOG_DIR, exist_ok=True)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "App") -> logging.Logger:
     """Create or return a logger with per-app log file."""
 
@@ -20,7 +26,8 @@ def get_logger(name: str = "App") -> logging.Logger:
     if logger.handlers:
         return logger
 
-    logger.setLevel(logging.DEBUG)
+    # Records below LOG_LEVEL are dropped before any message formatting happens
+    logger.setLevel(LOG_LEVEL)
 
     # Separate log file for each app
     log_file = os.path.join(LOG_DIR, f"{name}.log")
@@ -35,17 +42,25 @@ def get_logger(name: str = "App") -> logging.Logger:
     file_handler.setLevel(logging.INFO)
 
     # Colored console handler (only level name is colored)
-    console_formatter = colorlog.ColoredFormatter(
-        "[%(asctime)s] | %(log_color)s[%(levelname)s]%(reset)s | [%(name)s] | %(message)s",
-        datefmt="%H:%M:%S",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "bold_red",
-        },
-    )
+    if USE_COLORS:
+        import colorlog
+
+        console_formatter = colorlog.ColoredFormatter(
+            "[%(asctime)s] | %(log_color)s[%(levelname)s]%(reset)s | [%(name)s] | %(message)s",
+            datefmt="%H:%M:%S",
+            log_colors={
+                "DEBUG": "cyan",
+                "INFO": "green",
+                "WARNING": "yellow",
+                "ERROR": "red",
+                "CRITICAL": "bold_red",
+            },
+        )
+    else:
+        console_formatter = logging.Formatter(
+            fmt="[%(asctime)s] | [%(levelname)s] | [%(name)s] | %(message)s",
+            datefmt="%H:%M:%S",
+        )
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(console_formatter)
     console_handler.setLevel(logging.DEBUG)
@@ -1,76 +1,182 @@
 import os
+import re
+import logging
 from pathlib import Path
 from datetime import time
+from functools import lru_cache
 from zoneinfo import ZoneInfo
+from dataclasses import dataclass
 from dotenv import load_dotenv
 from modules.utils import parse_env_time
 
 
-def get_settings() -> dict:
-    """Read environment variables and return a dictionary of settings."""
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of the application settings."""
+
+    PROJECT_NAME: str
+    BASE_DIR: Path
+    LOG_LEVEL: str
+
+    # Scheduler Settings
+    SCHEDULER_ENABLED: bool
+    SCHEDULER_INTERVAL_MINUTES: int
+    SCHEDULER_START_TIME: time
+    SCHEDULER_END_TIME: time
+    SCHEDULER_TIME_ZONE: ZoneInfo
+
+    # Telegram Settings
+    ADMIN_CHAT_IDS: frozenset[int]
+    TELEGRAM_TOKEN: str | None
+    TELEGRAM_CHANNEL_ID: str | None
+    TELEGRAM_PROXY_URL: str | None
+
+    # Zarbaha Scraper Settings
+    ZARBAHA_TIMEOUT: int
+    ZARBAHA_INTERVAL: float
+    ZARBAHA_BUY_PRICE_RATE: int
+    ZARBAHA_SELL_PRICE_RATE: int
+    ZARBAHA_HTTP_ENABLED: bool
+    CHROMEDRIVER_PATH: str | None
+
+    # Celery Settings
+    BROKER_URL: str
+    RESULT_BACKEND: str
+
+    # Database Settings
+    GOLD_DB_FOLDER: Path
+    GOLD_DB_FILE: Path
+
+    # Value of the reload counter when this snapshot was read
+    GENERATION: int
+
+
+# Bumped on every reload, a Settings snapshot with an older GENERATION is stale
+_GENERATION = 0
+
+
+def reload_settings() -> None:
+    """Invalidate the cached settings, the .env file is read on next access."""
+    global _GENERATION
+    _GENERATION += 1
+    get_settings.cache_clear()
+
+
+def is_settings_stale(settings: Settings) -> bool:
+    """Return True if settings were reloaded since this snapshot was taken."""
+    return settings.GENERATION != _GENERATION
+
+
+_CHAT_ID = re.compile(r"-?\d+")
+
+
+def _parse_chat_ids(value: str) -> frozenset[int]:
+    """Parse comma separated chat IDs, skipping malformed ones with a warning."""
+    chat_ids = set()
+    for item in filter(None, map(str.strip, value.split(","))):
+        if _CHAT_ID.fullmatch(item):
+            chat_ids.add(int(item))
+        else:
+            # get_logger needs the settings, so log through the stdlib directly
+            logging.getLogger("Settings").warning(
+                f"Ignoring malformed chat ID in ADMIN_CHAT_IDS: {item!r}"
+            )
+    return frozenset(chat_ids)
+
+
+def _parse_log_level(value: str) -> str:
+    """Return the upper-cased level name, INFO with a warning if unknown."""
+    level = value.strip().upper()
+    if level in logging.getLevelNamesMapping():
+        return level
+
+    logging.getLogger("Settings").warning(
+        f"Unknown LOG_LEVEL {value!r}, falling back to INFO"
+    )
+    return "INFO"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Read environment variables and return the settings.
+
+    The result is cached for the lifetime of the process, call
+    `get_settings.cache_clear()` to force the .env file to be read again.
+    """
     BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
-    load_dotenv(override=True)
+    # Load the .env file from a known path instead of letting python-dotenv
+    # search for it through the parent directories
+    load_dotenv(os.environ.get("DOTENV_PATH") or BASE_DIR / ".env", override=True)
+
+    # Snapshot the environment once instead of going through os.getenv per key
+    env = dict(os.environ)
 
-    PROJECT_NAME = os.getenv("PROJECT_NAME", "GMiner")
+    PROJECT_NAME = env.get("PROJECT_NAME", "GMiner")
+    LOG_LEVEL = _parse_log_level(env.get("LOG_LEVEL", "INFO"))
 
     # Scheduler Settings
-    SCHEDULER_ENABLED = os.getenv("SCHEDULER_ENABLED", "True").lower() == "true"
-    SCHEDULER_INTERVAL_MINUTES = int(os.getenv("SCHEDULER_INTERVAL_MINUTES", "5"))
+    SCHEDULER_ENABLED = env.get("SCHEDULER_ENABLED", "True").lower() == "true"
+    SCHEDULER_INTERVAL_MINUTES = int(env.get("SCHEDULER_INTERVAL_MINUTES", "5"))
     SCHEDULER_START_TIME = parse_env_time(
-        os.getenv("SCHEDULER_START_TIME", "11:00"), time(11, 0)
+        env.get("SCHEDULER_START_TIME", "11:00"), time(11, 0)
     )
     SCHEDULER_END_TIME = parse_env_time(
-        os.getenv("SCHEDULER_END_TIME", "20:30"), time(20, 30)
+        env.get("SCHEDULER_END_TIME", "20:30"), time(20, 30)
     )
-    SCHEDULER_TIME_ZONE = ZoneInfo(os.getenv("SCHEDULER_TIME_ZONE", "Asia/Tehran"))
+    SCHEDULER_TIME_ZONE = ZoneInfo(env.get("SCHEDULER_TIME_ZONE", "Asia/Tehran"))
 
     # Telegram Settings
-    ADMIN_CHAT_IDS = set(
-        x.strip() for x in os.getenv("ADMIN_CHAT_IDS", "").split(",") if x.strip()
-    )
-    TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-    TELEGRAM_CHANNEL_ID = os.getenv("TELEGRAM_CHANNEL_ID")
-    TELEGRAM_PROXY_URL = os.getenv("TELEGRAM_PROXY_URL")
+    # Parsed to ints once so auth checks compare `user.id` directly
+    ADMIN_CHAT_IDS = _parse_chat_ids(env.get("ADMIN_CHAT_IDS", ""))
+    TELEGRAM_TOKEN = env.get("TELEGRAM_TOKEN")
+    TELEGRAM_CHANNEL_ID = env.get("TELEGRAM_CHANNEL_ID")
+    TELEGRAM_PROXY_URL = env.get("TELEGRAM_PROXY_URL")
 
     # Zarbaha Scraper Settings
-    ZARBAHA_TIMEOUT = int(os.getenv("ZARBAHA_TIMEOUT", "20"))
-    ZARBAHA_INTERVAL = float(os.getenv("ZARBAHA_INTERVAL", "1"))
-    ZARBAHA_BUY_PRICE_RATE = int(os.getenv("ZARBAHA_BUY_PRICE_RATE", "50000"))
-    ZARBAHA_SELL_PRICE_RATE = int(os.getenv("ZARBAHA_SELL_PRICE_RATE", "130000"))
+    ZARBAHA_TIMEOUT = int(env.get("ZARBAHA_TIMEOUT", "20"))
+    ZARBAHA_INTERVAL = float(env.get("ZARBAHA_INTERVAL", "1"))
+    ZARBAHA_BUY_PRICE_RATE = int(env.get("ZARBAHA_BUY_PRICE_RATE", "50000"))
+    ZARBAHA_SELL_PRICE_RATE = int(env.get("ZARBAHA_SELL_PRICE_RATE", "130000"))
+    ZARBAHA_HTTP_ENABLED = env.get("ZARBAHA_HTTP_ENABLED", "False").lower() == "true"
+    CHROMEDRIVER_PATH = env.get("CHROMEDRIVER_PATH") or None
 
     # Celery Settings
-    BROKER_URL = os.getenv("BROKER_URL", "redis://localhost:6379/0")
-    RESULT_BACKEND = os.getenv("RESULT_BACKEND", "redis://localhost:6379/1")
+    BROKER_URL = env.get("BROKER_URL", "redis://localhost:6379/0")
+    RESULT_BACKEND = env.get("RESULT_BACKEND", "redis://localhost:6379/1")
 
     # Database Settings
     GOLD_DB_FOLDER = BASE_DIR / "db"
-    GOLD_DB_FOLDER.mkdir(exist_ok=True)
     GOLD_DB_FILE: Path = GOLD_DB_FOLDER / "gold_prices.json"
 
-    return {
-        "PROJECT_NAME": PROJECT_NAME,
-        "BASE_DIR": BASE_DIR,
+    return Settings(
+        PROJECT_NAME=PROJECT_NAME,
+        BASE_DIR=BASE_DIR,
+        LOG_LEVEL=LOG_LEVEL,
         # Scheduler Settings
-        "SCHEDULER_ENABLED": SCHEDULER_ENABLED,
-        "SCHEDULER_INTERVAL_MINUTES": SCHEDULER_INTERVAL_MINUTES,
-        "SCHEDULER_START_TIME": SCHEDULER_START_TIME,
-        "SCHEDULER_END_TIME": SCHEDULER_END_TIME,
-        "SCHEDULER_TIME_ZONE": SCHEDULER_TIME_ZONE,
+        SCHEDULER_ENABLED=SCHEDULER_ENABLED,
+        SCHEDULER_INTERVAL_MINUTES=SCHEDULER_INTERVAL_MINUTES,
+        SCHEDULER_START_TIME=SCHEDULER_START_TIME,
+        SCHEDULER_END_TIME=SCHEDULER_END_TIME,
+        SCHEDULER_TIME_ZONE=SCHEDULER_TIME_ZONE,
         # Telegram Settings
-        "ADMIN_CHAT_IDS": ADMIN_CHAT_IDS,
-        "TELEGRAM_TOKEN": TELEGRAM_TOKEN,
-        "TELEGRAM_CHANNEL_ID": TELEGRAM_CHANNEL_ID,
-        "TELEGRAM_PROXY_URL": TELEGRAM_PROXY_URL,
+        ADMIN_CHAT_IDS=ADMIN_CHAT_IDS,
+        TELEGRAM_TOKEN=TELEGRAM_TOKEN,
+        TELEGRAM_CHANNEL_ID=TELEGRAM_CHANNEL_ID,
+        TELEGRAM_PROXY_URL=TELEGRAM_PROXY_URL,
         # Zarbaha Scraper Settings
-        "ZARBAHA_TIMEOUT": ZARBAHA_TIMEOUT,
-        "ZARBAHA_INTERVAL": ZARBAHA_INTERVAL,
-        "ZARBAHA_BUY_PRICE_RATE": ZARBAHA_BUY_PRICE_RATE,
-        "ZARBAHA_SELL_PRICE_RATE": ZARBAHA_SELL_PRICE_RATE,
+        ZARBAHA_TIMEOUT=ZARBAHA_TIMEOUT,
+        ZARBAHA_INTERVAL=ZARBAHA_INTERVAL,
+        ZARBAHA_BUY_PRICE_RATE=ZARBAHA_BUY_PRICE_RATE,
+        ZARBAHA_SELL_PRICE_RATE=ZARBAHA_SELL_PRICE_RATE,
+        ZARBAHA_HTTP_ENABLED=ZARBAHA_HTTP_ENABLED,
+        CHROMEDRIVER_PATH=CHROMEDRIVER_PATH,
         # Celery Settings
-        "BROKER_URL": BROKER_URL,
-        "RESULT_BACKEND": RESULT_BACKEND,
+        BROKER_URL=BROKER_URL,
+        RESULT_BACKEND=RESULT_BACKEND,
         # Database Settings
-        "GOLD_DB_FOLDER": GOLD_DB_FOLDER,
-        "GOLD_DB_FILE": GOLD_DB_FILE,
-    }
+        GOLD_DB_FOLDER=GOLD_DB_FOLDER,
+        GOLD_DB_FILE=GOLD_DB_FILE,
+        GENERATION=_GENERATION,
+    )
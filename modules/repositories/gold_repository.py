@@ -1,17 +1,45 @@
-import json
+import os
+import time
 import uuid
+import threading
+import orjson
+from collections import deque
+from pathlib import Path
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from modules.configs import get_settings
 
+try:
+    import fcntl
+except ImportError:  # Windows has no flock, writes are still atomic there
+    fcntl = None
+
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string with seconds precision."""
+    return datetime.now(_UTC).isoformat(timespec="seconds")
+
 
 class GoldRepository:
     """
     Repository for storing/retrieving gold prices as a list of entries.
     Each entry has a timestamp and a unique UUID.
+
+    Only the last `MAX_ENTRIES` entries are kept. They are held in memory and
+    the JSON file is a mirror of that buffer, so reads only stat() the file
+    to notice writes from other processes.
     """
 
+    # Number of most recent entries kept in the file
+    MAX_ENTRIES = 3
+
+    # Set once the DB folder exists, later instances skip the mkdir
+    _dir_ready = False
+
     def __init__(self):
         """
         Args:
@@ -19,50 +47,165 @@ class GoldRepository:
             timestamp_func (Callable): Function returning a timestamp string. Default is UTC now.
         """
         settings = get_settings()
-        self.db_file = settings["GOLD_DB_FILE"]
-        self.timestamp_func = lambda: datetime.now(timezone.utc).isoformat()
+        self.db_file = settings.GOLD_DB_FILE
+        self.lock_file = self.db_file.with_suffix(self.db_file.suffix + ".lock")
+        # Prices of the last channel message, shared by every process like the DB
+        self.sent_file = self.db_file.with_suffix(self.db_file.suffix + ".sent")
+        self.timestamp_func = _now_iso
+
+        # (inode, mtime, size) of the file as of our last read or write. The
+        # inode changes on every os.replace(), even when the mtime doesn't on
+        # filesystems with coarse timestamps.
+        self._file_key: Optional[Tuple[int, int, int]] = None
+
+        # Lock file descriptor, opened on first use and kept until close()
+        self._lock_fd: Optional[int] = None
+        self._thread_lock = threading.Lock()
+
+        self._ensure_db_dir()
 
-        if not self.db_file.exists():
-            self._write([])
+        with self._locked():
+            if not self.db_file.exists():
+                self._write([])
 
-    def create(self, price_data: Dict[str, Optional[int]]):
+            # Loaded once, every later read is served from memory
+            self._buffer: deque = deque(self._read(), maxlen=self.MAX_ENTRIES)
+
+    def create(self, price_data: Dict[str, Optional[int]]) -> Dict[str, Optional[int]]:
         """
         Add a new price entry with a timestamp and unique UUID,
         but keep ONLY the last 3 records in the file.
-        """
-        db = self._read()
 
+        Returns the stored entry.
+        """
         entry = {
             "id": str(uuid.uuid4()),
             "timestamp": self.timestamp_func(),
             **price_data,
         }
 
-        db.append(entry)
-        db = db[-3:]  # Keep only the last 3 records
+        with self._locked():
+            self._sync()
+            self._buffer.append(entry)  # deque drops the oldest entry itself
 
-        self._write(db)
+            self._write(list(self._buffer))
+
+        return entry
 
     def get_latest(self) -> Optional[Dict[str, Optional[int]]]:
         """Return the latest price entry."""
-        db = self._read()
-        if not db:
+        self._sync()
+        if not self._buffer:
             return None
-        return db[-1]
+        return self._buffer[-1]
+
+    def get_last_two(
+        self,
+    ) -> Tuple[Optional[Dict[str, Optional[int]]], Optional[Dict[str, Optional[int]]]]:
+        """Return the latest entry and the one before it, None where missing."""
+        self._sync()
+        buffer = self._buffer
+        latest = buffer[-1] if buffer else None
+        previous = buffer[-2] if len(buffer) >= 2 else None
+        return latest, previous
 
     def get_all(self) -> List[Dict[str, Optional[int]]]:
         """Return all stored price entries."""
-        return self._read()
+        self._sync()
+        return list(self._buffer)
+
+    def get_last_sent(self) -> Tuple[Optional[list], float]:
+        """Return the prices of the last channel message and its UNIX send time."""
+        try:
+            data = orjson.loads(self.sent_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None, 0.0
+        return data.get("prices"), data.get("sent_at", 0.0)
+
+    def set_last_sent(self, prices: list):
+        """Record `prices` as the last channel message, sent now."""
+        with self._locked():
+            self._replace(self.sent_file, {"prices": prices, "sent_at": time.time()})
+
+    def _sync(self):
+        """
+        Reload the buffer if another process (e.g. the Celery worker) wrote
+        the file since our last read or write. Costs one stat() otherwise.
+        """
+        try:
+            file_key = self._stat_key(self.db_file)
+        except FileNotFoundError:
+            return
+
+        if file_key != self._file_key:
+            self._buffer = deque(self._read(), maxlen=self.MAX_ENTRIES)
+
+    def _ensure_db_dir(self):
+        """Create the DB folder the first time a repository is constructed."""
+        if not GoldRepository._dir_ready:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            GoldRepository._dir_ready = True
+
+    def close(self):
+        """Close the lock file, a later write opens it again."""
+        with self._thread_lock:
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    @contextmanager
+    def _locked(self):
+        """
+        Hold an exclusive lock on the DB so processes write one at a time.
+
+        flock() doesn't exclude threads sharing the descriptor, so a thread
+        lock is taken first.
+        """
+        with self._thread_lock:
+            if fcntl is None:
+                yield
+                return
+
+            if self._lock_fd is None:
+                self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
 
     def _read(self) -> List[Dict]:
         """Read the JSON DB as a list of entries."""
         try:
-            with self.db_file.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
+            self._file_key = self._stat_key(self.db_file)
+            return orjson.loads(self.db_file.read_bytes())
+        except orjson.JSONDecodeError:
             return []
 
     def _write(self, data: List[Dict]):
-        """Write list of entries to JSON DB."""
-        with self.db_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """
+        Write list of entries to JSON DB.
+
+        The data goes to a temporary file that replaces the DB in one step,
+        so readers never see a half-written file.
+        """
+        self._replace(self.db_file, data)
+        self._file_key = self._stat_key(self.db_file)
+
+    @staticmethod
+    def _stat_key(path: Path) -> Tuple[int, int, int]:
+        """Identify the current version of `path` with a single stat()."""
+        st = path.stat()
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _replace(path: Path, data):
+        """Write `data` as JSON to a temporary file that replaces `path`."""
+        tmp_file = path.with_suffix(path.suffix + ".tmp")
+        with tmp_file.open("wb") as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_file, path)
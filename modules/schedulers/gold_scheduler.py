@@ -1,10 +1,10 @@
-from datetime import datetime
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import asyncio
+from typing import Optional
+from datetime import datetime, timedelta
 
 from modules.bots import TelegramBot
 from modules.services import GoldService
-from modules.configs import get_settings, get_logger
+from modules.configs import Settings, get_settings, get_logger, is_settings_stale
 
 
 class GoldScheduler:
@@ -13,36 +13,48 @@ class GoldScheduler:
     Runs every x minutes between start and end times of given timezone for a single day.
     """
 
-    def __init__(self, telegram_bot: TelegramBot):
+    def __init__(self, telegram_bot: TelegramBot, settings: Optional[Settings] = None):
         self.logger = get_logger("GoldScheduler")
 
-        self.settings = get_settings()
         self.telegram_bot = telegram_bot
 
-        self.SCHEDULER_TIME_ZONE = self.settings["SCHEDULER_TIME_ZONE"]
-
         # Lazy initialization of GoldService
         self._gold_service = None
 
-        self.END_TIME = self.settings["SCHEDULER_END_TIME"]
-        self.START_TIME = self.settings["SCHEDULER_START_TIME"]
+        self.update_settings(settings or get_settings())
+
+        self.SCHEDULER_TIME_ZONE = self.settings.SCHEDULER_TIME_ZONE
+        self.INTERVAL_MINUTES = int(self.settings.SCHEDULER_INTERVAL_MINUTES)
+
+        # Task running _loop(), set while the scheduler is started
+        self._task: Optional[asyncio.Task] = None
+
+    def update_settings(self, settings: Settings):
+        """
+        Apply a new settings snapshot to the job.
+
+        The time zone and interval are bound to the running loop and only
+        change after a restart.
+        """
+        self.settings = settings
+        self.END_TIME = settings.SCHEDULER_END_TIME
+        self.START_TIME = settings.SCHEDULER_START_TIME
 
-        self.INTERVAL_MINUTES = int(self.settings["SCHEDULER_INTERVAL_MINUTES"])
+        # Working hours as minutes since midnight, so each tick compares two ints
+        self._start_m = self.START_TIME.hour * 60 + self.START_TIME.minute
+        self._end_m = self.END_TIME.hour * 60 + self.END_TIME.minute
 
-        self.scheduler = AsyncIOScheduler(
-            timezone=self.SCHEDULER_TIME_ZONE,
-            job_defaults={
-                "coalesce": True,  # Prevent job pile-up
-                "max_instances": 1,  # Only one instance at a time
-                "misfire_grace_time": 30,  # Skip jobs that are >30s late
-            },
-        )
+        # The service reads the channel and time zone from its own snapshot
+        if self._gold_service is not None:
+            self._gold_service.update_settings(settings)
 
     @property
     def gold_service(self):
         """Lazy initialize GoldService to save memory."""
         if self._gold_service is None:
-            self._gold_service = GoldService(telegram_bot=self.telegram_bot)
+            self._gold_service = GoldService(
+                telegram_bot=self.telegram_bot, settings=self.settings
+            )
         return self._gold_service
 
     async def gold_price_job(self):
@@ -51,18 +63,24 @@ class GoldScheduler:
         Only executes during working hours (11:00-20:30 Tehran time) and if scheduler is enabled.
         """
         try:
+            # Pick up reloaded settings on the first tick after a reload
+            if is_settings_stale(self.settings):
+                self.update_settings(get_settings())
+
             # Check if scheduler is enabled
-            if not self.settings["SCHEDULER_ENABLED"]:
+            if not self.settings.SCHEDULER_ENABLED:
                 self.logger.info("Scheduler is disabled. Skipping price fetch.")
                 return
 
             # Get current Tehran time
             now = datetime.now(self.SCHEDULER_TIME_ZONE)
-            current_time = now.time()
+            now_m = now.hour * 60 + now.minute
 
             # Check working hours
-            if not (self.START_TIME <= current_time <= self.END_TIME):
-                self.logger.info(f"Outside working hours. Current time: {current_time}")
+            if not (self._start_m <= now_m <= self._end_m):
+                self.logger.info(
+                    f"Outside working hours. Current time: {now.strftime('%H:%M:%S')}"
+                )
                 return
 
             self.logger.info(f"Fetching price at {now.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -72,40 +90,102 @@ class GoldScheduler:
         except Exception as e:
             self.logger.error(f"Error in fetch_and_send: {e}", exc_info=True)
 
-    def start(self):
+    async def _loop(self):
+        """
+        Run the job on every interval boundary until cancelled.
+
+        The job is awaited before the next boundary is computed, so runs never
+        overlap and ticks missed by a slow run are skipped.
+        """
+        while True:
+            # The working hours decide the next wake-up, so refresh them first
+            if is_settings_stale(self.settings):
+                self.update_settings(get_settings())
+
+            now = datetime.now(self.SCHEDULER_TIME_ZONE)
+            # Subtracting aware datetimes of the same zone ignores DST changes,
+            # UNIX timestamps give the real number of seconds in between
+            delay = self._next_tick(now).timestamp() - now.timestamp()
+
+            # Sleeping past the working hours: don't keep the browser around
+            if delay > self.INTERVAL_MINUTES * 60 and self._gold_service is not None:
+                await self._gold_service.release_scraper()
+
+            await asyncio.sleep(delay)
+            await self.gold_price_job()
+
+    def _next_tick(self, now: datetime) -> datetime:
+        """
+        Next minute matching cron's `*/INTERVAL_MINUTES` inside working hours.
+
+        Outside working hours the loop sleeps straight to the first tick of
+        the next window instead of waking up every interval.
+        """
+        # A boundary less than a second away counts as passed, so a sleep that
+        # wakes a little early doesn't run the job twice for the same tick
+        tick = (now + timedelta(seconds=1)).replace(second=0, microsecond=0)
+        tick = self._align(tick + timedelta(minutes=1))
+
+        tick_m = tick.hour * 60 + tick.minute
+        if tick_m > self._end_m:
+            tick += timedelta(days=1)
+        if not (self._start_m <= tick_m <= self._end_m):
+            tick = self._align(
+                tick.replace(hour=self.START_TIME.hour, minute=self.START_TIME.minute)
+            )
+
+        return tick
+
+    def _align(self, tick: datetime) -> datetime:
+        """First minute at or after `tick` matching `*/INTERVAL_MINUTES`."""
+        minute = -(-tick.minute // self.INTERVAL_MINUTES) * self.INTERVAL_MINUTES
+
+        if minute >= 60:
+            return tick.replace(minute=0) + timedelta(hours=1)
+        return tick.replace(minute=minute)
+
+    def start(self) -> asyncio.Task:
         """
         Start the scheduler with a job that runs every x minutes.
+        Must be called from a running event loop.
+
+        Returns the task running the loop, await it to see its errors.
         """
         try:
-            # Schedule job to run every x minutes
-            self.scheduler.add_job(
-                self.gold_price_job,
-                trigger=CronTrigger(
-                    minute=f"*/{self.INTERVAL_MINUTES}",
-                    timezone=self.SCHEDULER_TIME_ZONE,
-                ),
-                id="price_fetch_job",
-                name=f"Fetch and send price every {self.INTERVAL_MINUTES} minutes",
-                replace_existing=True,
-            )
+            if self._task is not None:
+                return self._task
+
+            self._task = asyncio.create_task(self._loop(), name="gold-price-job")
 
             self.logger.info(
                 f"Scheduler started. Will fetch gold prices every {self.INTERVAL_MINUTES} minutes "
                 f"(between {self.START_TIME} and {self.END_TIME}) {self.SCHEDULER_TIME_ZONE}"
             )
-            self.scheduler.start()
 
         except Exception as e:
             self.logger.error(f"Error starting scheduler: {e}")
             raise
 
-    def stop(self):
+        return self._task
+
+    async def stop(self):
         """
         Stop the scheduler gracefully.
+
+        The loop is cancelled and awaited before the service is closed, so no
+        job is still using it.
         """
         try:
-            if self.scheduler.running:
-                self.scheduler.shutdown(wait=True)
+            task, self._task = self._task, None
+            if task is not None:
+                task.cancel()
+                # wait() neither raises the loop's error, already reported to
+                # whoever awaits start(), nor swallows our own cancellation
+                await asyncio.wait([task])
                 self.logger.info("Scheduler stopped")
+
+            if self._gold_service is not None:
+                self._gold_service.close()
+                self._gold_service = None
         except Exception as e:
             self.logger.error(f"Error stopping scheduler: {e}")
@@ -1 +1,3 @@
 from .zarbaha_scraper import ZarbahaScraper
+from .zarbaha_http_scraper import ZarbahaHttpScraper
+from .factory import get_scraper
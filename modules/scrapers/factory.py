@@ -0,0 +1,17 @@
+from functools import lru_cache
+
+from modules.configs import get_settings
+from .zarbaha_scraper import ZarbahaScraper
+from .zarbaha_http_scraper import ZarbahaHttpScraper
+
+
+@lru_cache(maxsize=1)
+def get_scraper() -> ZarbahaScraper | ZarbahaHttpScraper:
+    """
+    Return the process-wide Zarbaha scraper, created on first use.
+
+    Plain HTTP avoids starting Chrome, Selenium remains the default.
+    """
+    if get_settings().ZARBAHA_HTTP_ENABLED:
+        return ZarbahaHttpScraper()
+    return ZarbahaScraper(headless=True)
@@ -0,0 +1,129 @@
+import re
+import time
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Dict, Optional
+from modules.utils import parse_price
+from modules.configs import get_settings, get_logger
+
+from .zarbaha_scraper import ZarbahaScraper
+
+
+class ZarbahaHttpScraper:
+    """
+    Scraper that reads the gold price from the Zarbaha page over plain HTTP.
+
+    It fetches the HTML and reads the estimate from the `_g_m` element with
+    BeautifulSoup, no browser involved. It only works while the price is
+    present in the served HTML, so it is enabled with `ZARBAHA_HTTP_ENABLED`
+    and `ZarbahaScraper` (Selenium) stays the default. When the page has no
+    price it falls back to `ZarbahaScraper` for that scrape.
+
+    Returns the same dictionary as `ZarbahaScraper.scrape()`.
+    """
+
+    URL: str = "https://zarbaha-co.ir/"
+
+    # CSS selector of the estimate element
+    ESTIMATE_SELECTOR = "._g_m"
+
+    # Only elements with this class are parsed, the rest of the page is skipped.
+    # The class attribute is still one string while parsing, hence the regex.
+    _ESTIMATE_ONLY = SoupStrainer(class_=re.compile(r"(?:^|\s)_g_m(?:\s|$)"))
+
+    # Page loads tried when the price is missing or still "0", waiting
+    # BACKOFF seconds after the first and doubling after each further one
+    ATTEMPTS = 3
+    BACKOFF = 1
+
+    # One client for all instances so the TLS connection is kept alive
+    _client: Optional[httpx.Client] = None
+
+    def __init__(self):
+        self.logger = get_logger("ZarbahaHttpScraper")
+
+        self.settings = get_settings()
+
+        self.timeout = self.settings.ZARBAHA_TIMEOUT
+        self.buy_price_rate = self.settings.ZARBAHA_BUY_PRICE_RATE
+        self.sell_price_rate = self.settings.ZARBAHA_SELL_PRICE_RATE
+
+        if ZarbahaHttpScraper._client is None:
+            ZarbahaHttpScraper._client = httpx.Client(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": "Mozilla/5.0"},
+            )
+        self.client = ZarbahaHttpScraper._client
+
+        # Browser scraper for pages without the price, started on first need
+        self._browser: Optional[ZarbahaScraper] = None
+
+    def scrape(self) -> Dict[str, int | None]:
+        """Extract and compute prices."""
+        try:
+            for attempt in range(self.ATTEMPTS):
+                if attempt:
+                    time.sleep(self.BACKOFF * 2 ** (attempt - 1))
+
+                response = self.client.get(self.URL)
+                response.raise_for_status()
+
+                estimate_price = self._parse_estimate(response.content)
+
+                if estimate_price is not None:
+                    return {
+                        "sell_price_toman": estimate_price + self.sell_price_rate,
+                        "buy_price_toman": estimate_price - self.buy_price_rate,
+                        "estimate_price_toman": estimate_price,
+                    }
+
+            self.logger.warning(
+                "Estimate price not found in page HTML, falling back to the browser"
+            )
+            if self._browser is None:
+                self._browser = ZarbahaScraper(headless=True)
+            return self._browser.scrape()
+
+        except Exception as e:
+            self.logger.error(f"Error during scraping: {e}")
+            return self._empty_prices()
+
+    def close(self):
+        """
+        Release the fallback browser, if any. The shared client is kept open,
+        call cleanup() on shutdown instead.
+        """
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+
+    def cleanup(self):
+        """Call this ONCE on application shutdown to close the shared client."""
+        if ZarbahaHttpScraper._client is not None:
+            ZarbahaHttpScraper._client.close()
+            ZarbahaHttpScraper._client = None
+            self.logger.info("Shared HTTP client closed")
+
+        ZarbahaScraper.cleanup()
+
+    def _parse_estimate(self, html: bytes) -> int | None:
+        """Return the estimate price found in the page, or None."""
+        soup = BeautifulSoup(html, "html.parser", parse_only=self._ESTIMATE_ONLY)
+        element = soup.select_one(self.ESTIMATE_SELECTOR)
+        if element is None:
+            return None
+
+        try:
+            price = parse_price(element.get_text(strip=True))
+        except ValueError:
+            return None
+        return price or None
+
+    @staticmethod
+    def _empty_prices() -> Dict[str, int | None]:
+        return {
+            "sell_price_toman": None,
+            "buy_price_toman": None,
+            "estimate_price_toman": None,
+        }
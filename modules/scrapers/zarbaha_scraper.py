@@ -1,13 +1,17 @@
-import re
-import time
+import os
+import shutil
+import atexit
+import threading
+import tempfile
+from pathlib import Path
 from typing import Dict
+from functools import lru_cache
+from modules.utils import parse_price
 from modules.configs import get_settings, get_logger
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.common.exceptions import WebDriverException
 
 
 class ZarbahaScraper:
@@ -32,9 +36,31 @@ class ZarbahaScraper:
     # usecase: Target website for scraping. Change here if website address changes.
     URL: str = "https://zarbaha-co.ir/"
 
+    # Chrome profile kept between driver starts so the site's scripts, styles
+    # and fonts come from the disk cache. One subfolder per process because
+    # Chrome locks a profile to a single browser, removed by cleanup(force=True).
+    PROFILE_DIR: Path = Path(tempfile.gettempdir()) / "zarbaha-chrome"
+
+    # Upper bound for the disk cache inside the profile (50 MB)
+    DISK_CACHE_SIZE: int = 50 * 1024 * 1024
+
+    # Requests the price widget doesn't need, blocked through CDP
+    BLOCKED_URLS: tuple[str, ...] = (
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.mp4",
+        "*.webm",
+        "*googletagmanager*",
+        "*analytics*",
+    )
+
     # Class-level driver for reuse across all instances
     _shared_driver = None
-    _driver_lock = None  # For thread safety
+    _driver_lock = threading.Lock()  # Guards the driver and the refcount
+
+    # Number of open scraper instances using the shared driver
+    _refcount = 0
 
     def __init__(self, headless: bool = True):
 
@@ -46,24 +72,28 @@ class ZarbahaScraper:
 
         # usecase: Maximum wait time (in seconds) for stabilizing a dynamically-updated number.
         # The website frequently updates prices with JavaScript, so waiting ensures accuracy.
-        self.timeout = int(self.settings["ZARBAHA_TIMEOUT"])
+        self.timeout = self.settings.ZARBAHA_TIMEOUT
 
         # usecase: Delay between each check while waiting for the number to stabilize.
         # Balanced between speed and CPU usage.
-        self.interval = float(self.settings["ZARBAHA_INTERVAL"])
+        self.interval = self.settings.ZARBAHA_INTERVAL
 
         # usecase: Business rule (site-specific): buy price = estimate - BUY_PRICE_RATE.
-        self.buy_price_rate = int(self.settings["ZARBAHA_BUY_PRICE_RATE"])
+        self.buy_price_rate = self.settings.ZARBAHA_BUY_PRICE_RATE
 
         # usecase: Business rule (site-specific): sell price = estimate + SELL_PRICE_RATE.
-        self.sell_price_rate = int(self.settings["ZARBAHA_SELL_PRICE_RATE"])
+        self.sell_price_rate = self.settings.ZARBAHA_SELL_PRICE_RATE
 
         # Use shared driver instead of creating new one
-        if ZarbahaScraper._shared_driver is None:
-            options = self._configure_options()
-            self._init_driver(options)
-        else:
-            self.driver = ZarbahaScraper._shared_driver
+        with ZarbahaScraper._driver_lock:
+            if ZarbahaScraper._shared_driver is None:
+                options = self._configure_options()
+                self._init_driver(options)
+            else:
+                self.driver = ZarbahaScraper._shared_driver
+
+            ZarbahaScraper._refcount += 1
+            self._closed = False
 
     def scrape(self) -> Dict[str, int | None]:
         """Extract and compute prices."""
@@ -71,11 +101,9 @@ class ZarbahaScraper:
             # Refresh page to get latest data
             self.driver.refresh()
 
-            # Fetch raw text from the estimate element
-            raw_estimate = self._get_price("_g_m")
-
-            # raw_sell_price_toman = self._get_price("_g_g")
-            # raw_buy_price_toman = self._get_price("_g_k")
+            # Fetch raw text from the estimate element. The sell ("_g_g") and
+            # buy ("_g_k") elements can be added to the same call if needed.
+            raw_estimate = self._get_prices("_g_m")["_g_m"]
 
             # Clean and convert the raw text into an integer or fail gracefully
             estimate_price = self._clean_price_string(raw_estimate)
@@ -105,38 +133,63 @@ class ZarbahaScraper:
 
     def close(self):
         """
-        DON'T close shared driver - it's reused.
-        Call cleanup() on app shutdown instead.
+        Release this instance. The shared driver is kept alive for reuse,
+        call cleanup() on app shutdown to close it.
         """
+        with ZarbahaScraper._driver_lock:
+            if not self._closed:
+                self._closed = True
+                ZarbahaScraper._refcount -= 1
+
         self.logger.info("Scraper instance released (driver kept alive)")
 
-    # def close(self):
-    #     """
-    #     Properly closes and quits the WebDriver instance.
-
-    #     Avoids zombie browser processes.
-    #     """
-    #     if hasattr(self, "driver") and self.driver:
-    #         self.driver.quit()
-    #         # self.driver = None
-    #         self.logger.info("WebDriver closed")
-
-    def cleanup(self):
-        """Call this ONCE on application shutdown to close shared driver."""
-        if self._shared_driver:
-            try:
-                self._shared_driver.quit()
-                self._shared_driver = None
-                self.logger.info("Shared driver closed")
-            except Exception as e:
-                self.logger.error(f"Error closing shared driver: {e}")
+    @classmethod
+    def cleanup(cls, force: bool = False):
+        """
+        Close the shared driver once no scraper instance uses it.
+
+        With `force` it is closed regardless and the process's profile is
+        deleted, this runs at interpreter exit so neither the browser nor its
+        cache outlive the process.
+        """
+        with cls._driver_lock:
+            if cls._shared_driver is not None and (cls._refcount == 0 or force):
+                logger = get_logger("ZarbahaScraper")
+                try:
+                    cls._shared_driver.quit()
+                    logger.info("Shared driver closed")
+                except Exception as e:
+                    logger.error(f"Error closing shared driver: {e}")
+                finally:
+                    cls._shared_driver = None
+                    cls._refcount = 0
+
+            if force:
+                shutil.rmtree(cls._profile_dir(), ignore_errors=True)
+
+    @classmethod
+    def _profile_dir(cls) -> Path:
+        """Chrome profile folder of the current process."""
+        return cls.PROFILE_DIR / str(os.getpid())
 
     def _configure_options(self) -> webdriver.ChromeOptions:
         """Configure Chrome for minimal resource usage."""
+        profile_dir = self._profile_dir()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return self._build_options(self.headless, str(profile_dir))
+
+    @staticmethod
+    @lru_cache(maxsize=2)
+    def _build_options(headless: bool, profile_dir: str) -> webdriver.ChromeOptions:
+        """Build the Chrome options once per (headless, profile) pair."""
         options = webdriver.ChromeOptions()
 
+        # Return from get()/refresh() at DOMContentLoaded, _get_prices waits
+        # for the price elements on its own
+        options.page_load_strategy = "eager"
+
         # Enables headless mode when running on servers or background tasks
-        if self.headless:
+        if headless:
             options.add_argument("--headless=new")
             options.add_argument("--disable-gpu")
 
@@ -160,6 +213,10 @@ class ZarbahaScraper:
         # Memory limits
         options.add_argument("--max-old-space-size=512")  # Limit V8 heap
 
+        # Persistent profile and bounded disk cache
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument(f"--disk-cache-size={ZarbahaScraper.DISK_CACHE_SIZE}")
+
         # Sandbox settings required for Docker/Linux environments
         # options.add_argument("--no-sandbox")
         # options.add_argument("--disable-dev-shm-usage")
@@ -168,10 +225,21 @@ class ZarbahaScraper:
     def _init_driver(self, options: webdriver.ChromeOptions):
         """Initialize shared Chrome WebDriver."""
         try:
-            service = Service(ChromeDriverManager().install())
+            # A pinned binary skips the lookup, otherwise Selenium Manager
+            # resolves (and caches) a driver matching the installed Chrome
+            service = Service(executable_path=self.settings.CHROMEDRIVER_PATH)
             self.driver = webdriver.Chrome(service=service, options=options)
             ZarbahaScraper._shared_driver = self.driver
 
+            # Leave room for _get_prices to run its full timeout
+            self.driver.set_script_timeout(self.timeout + 5)
+
+            # Skip fonts, media and trackers on every page load
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(self.BLOCKED_URLS)}
+            )
+
             # Navigate to site once
             self._open_website(self.URL)
 
@@ -187,42 +255,54 @@ class ZarbahaScraper:
             self.logger.error(f"Failed to navigate to {url}: {e}")
             raise
 
-    def _wait_for_stable_text(self, element) -> str:
-        """Wait for element text to stabilize."""
-        last_text = element.text
-        elapsed = 0
-
-        while elapsed < self.timeout:
-            time.sleep(self.interval)
-            elapsed += self.interval
-
-            current_text = element.text
-
-            # If the price stops changing and is not 0, return it
-            if current_text == last_text and current_text != "0":
-                return current_text
-
-            last_text = current_text
+    # Reads the text of every requested element in the browser and resolves
+    # once two consecutive readings match and none is "0", or with the last
+    # readings on timeout. Elements are looked up on every reading since the
+    # page may still be rendering them, missing ones read as "N/A".
+    _STABLE_TEXT_SCRIPT = """
+        const [classNames, interval, timeout, done] = arguments;
+        const read = () => classNames.map((name) => {
+            const el = document.getElementsByClassName(name)[0];
+            return el ? el.innerText : "N/A";
+        });
+        let last = read();
+        let elapsed = 0;
+        const timer = setInterval(() => {
+            elapsed += interval;
+            const current = read();
+            const stable = current.every(
+                (text, i) => text === last[i] && text !== "0" && text !== "N/A"
+            );
+            if (stable || elapsed >= timeout) {
+                clearInterval(timer);
+                done(current);
+            }
+            last = current;
+        }, interval);
+    """
 
-        # Return last-seen value after timeout
-        return last_text
+    def _get_prices(self, *class_names: str) -> Dict[str, str]:
+        """
+        Get the stabilized text of several price elements, keyed by class name.
 
-    def _fetch_price_element(self, class_name: str):
-        """Fetch DOM element by class name."""
+        All elements are read by one WebDriver call, the polling runs in the page.
+        """
         try:
-            return self.driver.find_element(By.CLASS_NAME, class_name)
-        except (NoSuchElementException, WebDriverException) as e:
-            self.logger.error(f"Error fetching element '{class_name}': {e}")
-            return None
-
-    def _get_price(self, class_name: str) -> str:
-        """Get price text from page element."""
-        elem = self._fetch_price_element(class_name)
+            texts = self.driver.execute_async_script(
+                self._STABLE_TEXT_SCRIPT,
+                list(class_names),
+                int(self.interval * 1000),
+                int(self.timeout * 1000),
+            )
+        except WebDriverException as e:
+            self.logger.error(f"Error fetching elements {class_names}: {e}")
+            return dict.fromkeys(class_names, "N/A")
 
-        if elem:
-            return self._wait_for_stable_text(elem)
+        for class_name, text in zip(class_names, texts):
+            if text == "N/A":
+                self.logger.error(f"Element '{class_name}' not found")
 
-        return "N/A"
+        return dict(zip(class_names, texts))
 
     # ----------------- Data Cleaning Helpers ----------------- #
     def _clean_price_string(self, value: str) -> int | None:
@@ -231,9 +311,7 @@ class ZarbahaScraper:
             return None
 
         try:
-            # Remove all characters except digits
-            number = re.sub(r"[^\d]", "", value)
-            return int(number)
+            return parse_price(value)
         except Exception as e:
             self.logger.error(f"Error cleaning price '{value}': {e}")
             return None
@@ -246,3 +324,6 @@ class ZarbahaScraper:
         for key, value in raw_prices.items():
             cleaned[key] = self._clean_price_string(value)
         return cleaned
+
+
+atexit.register(ZarbahaScraper.cleanup, force=True)
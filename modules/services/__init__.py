@@ -1 +1,2 @@
 from .gold_service import GoldService
+from .price_message import format_price_message
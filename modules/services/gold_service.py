@@ -1,10 +1,15 @@
-import jdatetime
-from datetime import datetime
+import time
+import asyncio
+from functools import partial
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from modules.bots import TelegramBot
 from modules.repositories import GoldRepository
-from modules.configs import get_settings, get_logger
-from modules.scrapers.zarbaha_scraper import ZarbahaScraper
+from modules.configs import Settings, get_settings, get_logger
+from modules.scrapers import get_scraper
+
+from .price_message import MESAQAL_TO_GRAM, format_price_message
 
 
 class GoldService:
@@ -12,62 +17,173 @@ class GoldService:
     Service layer for business logic around gold prices.
     """
 
-    MESAQAL_TO_GRAM = 4.331802  # every mesqal is how many grams?
+    MESAQAL_TO_GRAM = MESAQAL_TO_GRAM
+
+    # Unchanged prices are sent again after this many seconds, so the channel
+    # still sees a fresh timestamp when the market is quiet
+    RESEND_AFTER_SECONDS = 3600
 
-    def __init__(self, telegram_bot: TelegramBot):
+    def __init__(self, telegram_bot: TelegramBot, settings: Optional[Settings] = None):
         self.logger = get_logger("GoldService")
-        self.settings = get_settings()
 
         self.repo = GoldRepository()
         self.telegram_bot = telegram_bot
-        self.scraper = ZarbahaScraper(headless=True)
 
-        self.SCHEDULER_TIME_ZONE = self.settings["SCHEDULER_TIME_ZONE"]
+        # Created on the first scrape, see the scraper property
+        self._scraper = None
+
+        # One long-lived thread runs every scrape, so the browser session is
+        # always driven from the same OS thread. Created by the first run(),
+        # callers of fetch_latest() (the Celery task) scrape on their own thread.
+        self._scrape_pool: Optional[ThreadPoolExecutor] = None
+
+        self.update_settings(settings or get_settings())
+
+    def update_settings(self, settings: Settings):
+        """Apply a new settings snapshot, used from the next run on."""
+        self.settings = settings
+        self.SCHEDULER_TIME_ZONE = settings.SCHEDULER_TIME_ZONE
+
+    @property
+    def scraper(self):
+        """Lazy initialize the scraper so Chrome only starts when first needed."""
+        if self._scraper is None:
+            self._scraper = get_scraper()
+        return self._scraper
+
+    async def release_scraper(self):
+        """
+        Close the scraper until the next scrape, e.g. outside working hours.
+
+        Runs on the scrape thread so it never overlaps a scrape in progress.
+        """
+        if self._scraper is not None:
+            await asyncio.get_running_loop().run_in_executor(
+                self.__get_scrape_pool(), self.close_scraper
+            )
 
     async def run(self):
         """Run the price fetching task."""
         try:
-            # Get the latest stored price
-            success, latest = self.__get_latest_price()
+            # Scraping blocks on the browser for seconds, run it off the event
+            # loop so the bot keeps answering commands meanwhile
+            loop = asyncio.get_running_loop()
+            success, (latest, prev) = await loop.run_in_executor(
+                self.__get_scrape_pool(), self.fetch_latest
+            )
+
+            # Same prices as the last send (a quiet market, or the scrape
+            # failed and the stored price was reused): skip until stale.
+            # Reads the repository, which may wait on other processes' locks.
+            unchanged = latest is not None and await loop.run_in_executor(
+                self.__get_scrape_pool(), self.is_unchanged, latest
+            )
 
             if not success:
                 self.logger.warning("Failed to fetch valid price.")
                 await self.telegram_bot.notify_admins(
                     "❌ Failed to fetch valid price! using previous price instead..."
+                    if latest and not unchanged
+                    else "❌ Failed to fetch valid price!"
                 )
 
             if latest:
-                # Try to get the previous stored price (one before latest)
-                try:
-                    # repository stores entries in a file; get all and pick second-last
-                    all_entries = self.repo.get_all()
-                    prev = all_entries[-2] if len(all_entries) >= 2 else None
-                except Exception:
-                    prev = None
+                if unchanged:
+                    self.logger.info("Price unchanged since last send, skipping.")
+                    return
 
                 # Format message with direction icon based on estimate_price_toman
                 message = self.__format_message(latest, previous=prev)
 
                 # Send to channel
-                channel_id = self.settings["TELEGRAM_CHANNEL_ID"]
+                channel_id = self.settings.TELEGRAM_CHANNEL_ID
+                # Only a delivered message counts as sent, a failed or dropped
+                # one is tried again on the next tick
                 await self.telegram_bot.send_channel_message(
                     channel_id=channel_id,
                     text=message,
+                    on_sent=partial(self.__mark_sent_async, latest),
                 )
 
-                self.logger.info(f"Price update sent to channel: {channel_id}")
+                self.logger.info(f"Price update queued for channel: {channel_id}")
 
         except Exception as e:
             self.logger.error(f"Error in while fetching price: {e}", exc_info=True)
 
-    def __get_latest_price(self):
-        """Retrieve the most recent stored price."""
-        success = self.__fetch_data()
-        prices = self.repo.get_latest()
-        return (success, prices)
+    def is_unchanged(self, latest: dict) -> bool:
+        """Whether `latest` repeats the last send and that send isn't stale yet."""
+        # Kept in the repository, so all processes sending to the channel
+        # compare against the same last message
+        prices, sent_at = self.repo.get_last_sent()
+        return (
+            self.__prices_of(latest) == prices
+            and time.time() - sent_at < self.RESEND_AFTER_SECONDS
+        )
+
+    def mark_sent(self, latest: dict):
+        """Record `latest` as the entry last sent to the channel."""
+        self.repo.set_last_sent(self.__prices_of(latest))
+
+    async def __mark_sent_async(self, latest: dict):
+        """Run mark_sent() on the scrape thread, its write locks and fsyncs."""
+        await asyncio.get_running_loop().run_in_executor(
+            self.__get_scrape_pool(), self.mark_sent, latest
+        )
+
+    @staticmethod
+    def __prices_of(entry: dict) -> list:
+        return [
+            entry.get("estimate_price_toman"),
+            entry.get("buy_price_toman"),
+            entry.get("sell_price_toman"),
+        ]
+
+    def close(self):
+        """Stop the scrape thread, a scrape in progress is left to finish."""
+        if self._scrape_pool is not None:
+            self._scrape_pool.shutdown(wait=False, cancel_futures=True)
+            self._scrape_pool = None
+        self.repo.close()
+
+    def __get_scrape_pool(self) -> ThreadPoolExecutor:
+        if self._scrape_pool is None:
+            self._scrape_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="scraper"
+            )
+        return self._scrape_pool
+
+    def close_scraper(self):
+        """
+        Close the scraper until the next scrape, blocking version of
+        release_scraper() for callers that scrape on their own thread.
+        """
+        if self._scraper is None:
+            return
+
+        self._scraper.close()
+        self._scraper.cleanup()
+        self._scraper = None
+
+        # The next scraper property access creates a fresh instance
+        get_scraper.cache_clear()
+        self.logger.info("Scraper released until the next scrape")
+
+    def fetch_latest(self):
+        """
+        Fetch and store a new price.
+
+        Returns whether it succeeded and the (latest, previous) stored
+        entries. Blocks while scraping.
+        """
+        entry = self.__fetch_data()
+
+        # Read back from the repository rather than kept in memory, so entries
+        # stored by other processes (Celery workers, the bot) are taken into
+        # account. It only costs a stat() unless the file changed.
+        return (entry is not None, self.repo.get_last_two())
 
     def __fetch_data(self):
-        """Fetch price from Zarbaha and store it."""
+        """Fetch price from Zarbaha and store it, returning the stored entry."""
         try:
             prices = self.scraper.scrape()
             # Extract price data
@@ -75,83 +191,22 @@ class GoldService:
             # check validity
             if estimate_price is not None and estimate_price > 0:
                 # Create new entry in repository
-                self.repo.create(prices)
+                entry = self.repo.create(prices)
                 self.logger.info(f"Price stored: {prices}")
-                return True
+                return entry
 
-            return False
+            return None
 
         except Exception as e:
             self.logger.error(f"Error in fetching price: {e}")
-            return False
+            return None
 
         # finally:
         #     self.scraper.close()
 
     def __format_message(self, price_data: dict, previous: dict | None = None) -> str:
-        """Format the price data into an HTML message for Telegram.
-
-        Shows an icon at the top: green (up) if estimate rose since previous entry,
-        red (down) if fell, yellow when unchanged or unknown.
-        """
-        ts = price_data.get("timestamp")
-        buy_mesqal = price_data.get("buy_price_toman")
-        sell_mesqal = price_data.get("sell_price_toman")
-        estimate_mesqal = price_data.get("estimate_price_toman")
-
-        # Convert timestamp to Persian datetime
-        if ts:
-            dt = datetime.fromisoformat(ts).astimezone(self.SCHEDULER_TIME_ZONE)
-            persian_dt = jdatetime.datetime.fromgregorian(datetime=dt)
-            formatted_ts = persian_dt.strftime("%Y/%m/%d - %H:%M:%S")
-        else:
-            formatted_ts = "N/A"
-
-        def format_price(p):
-            return f"{p:,} تومان" if p is not None else "N/A"
-
-        def calc_per_gram(price_mesqal):
-            if price_mesqal is None:
-                return None
-            per_gram = price_mesqal / self.MESAQAL_TO_GRAM
-            return round(per_gram)
-
-        buy_per_gram = calc_per_gram(buy_mesqal)
-        sell_per_gram = calc_per_gram(sell_mesqal)
-
-        # Determine direction icon
-        direction_icon = "🟡"
-        try:
-            if (
-                previous
-                and previous.get("estimate_price_toman") is not None
-                and estimate_mesqal is not None
-            ):
-                prev_est = previous.get("estimate_price_toman")
-                if estimate_mesqal > prev_est:
-                    direction_icon = "🟢"
-                elif estimate_mesqal < prev_est:
-                    direction_icon = "🔴"
-                else:
-                    direction_icon = "⚪"
-            else:
-                # if we don't have previous or current estimate, keep neutral
-                direction_icon = "⚪"
-        except Exception:
-            direction_icon = "⚪"
-
-        message = (
-            f"{direction_icon} <b>گزارش لحظه‌ای قیمت طلا</b>\n\n"
-            f"💵 <b>خرید</b>\n"
-            f"• 🪙 <b>مظنه:</b> {format_price(buy_mesqal)}\n"
-            f"• ⚖️ <b>قیمت هر گرم:</b> {format_price(buy_per_gram)}\n\n"
-            f"💰 <b>فروش</b>\n"
-            f"• 🪙 <b>مظنه:</b> {format_price(sell_mesqal)}\n"
-            f"• ⚖️ <b>قیمت هر گرم:</b> {format_price(sell_per_gram)}\n\n"
-            f"⏱️ <b>تاریخ و زمان:</b> {formatted_ts}"
-        )
-
-        return message.strip()
+        """Format the price data into an HTML message for Telegram."""
+        return format_price_message(price_data, previous, tz=self.SCHEDULER_TIME_ZONE)
 
 
 # Example if you want Iran time instead of UTC:
@@ -0,0 +1,78 @@
+import jdatetime
+from typing import Final
+from functools import lru_cache
+from datetime import datetime, tzinfo
+
+MESAQAL_TO_GRAM: Final[float] = 4.331802  # every mesqal is how many grams?
+_INV_MESAQAL_TO_GRAM: Final[float] = 1.0 / MESAQAL_TO_GRAM
+
+# Channel message, built once at import and filled per tick with format_map
+_MESSAGE_TEMPLATE: Final[str] = (
+    "{direction_icon} <b>گزارش لحظه‌ای قیمت طلا</b>\n\n"
+    "💵 <b>خرید</b>\n"
+    "• 🪙 <b>مظنه:</b> {buy_mesqal}\n"
+    "• ⚖️ <b>قیمت هر گرم:</b> {buy_per_gram}\n\n"
+    "💰 <b>فروش</b>\n"
+    "• 🪙 <b>مظنه:</b> {sell_mesqal}\n"
+    "• ⚖️ <b>قیمت هر گرم:</b> {sell_per_gram}\n\n"
+    "⏱️ <b>تاریخ و زمان:</b> {timestamp}"
+)
+
+
+def _format_price(price: int | None) -> str:
+    return f"{price:,} تومان" if price is not None else "N/A"
+
+
+def _per_gram(price_mesqal: int | None) -> int | None:
+    if price_mesqal is None:
+        return None
+    return round(price_mesqal * _INV_MESAQAL_TO_GRAM)
+
+
+@lru_cache(maxsize=64)
+def _format_timestamp(ts: str, tz: tzinfo) -> str:
+    """Convert an ISO timestamp to a Persian date string in `tz`."""
+    dt = datetime.fromisoformat(ts).astimezone(tz)
+    return jdatetime.datetime.fromgregorian(datetime=dt).strftime("%Y/%m/%d - %H:%M:%S")
+
+
+def format_price_message(
+    price_data: dict, previous: dict | None = None, *, tz: tzinfo
+) -> str:
+    """Format the price data into an HTML message for Telegram.
+
+    Shows an icon at the top: green (up) if estimate rose since previous entry,
+    red (down) if fell, white when unchanged or unknown.
+    """
+    ts = price_data.get("timestamp")
+    buy_mesqal = price_data.get("buy_price_toman")
+    sell_mesqal = price_data.get("sell_price_toman")
+    estimate_mesqal = price_data.get("estimate_price_toman")
+
+    # Convert timestamp to Persian datetime
+    if ts:
+        formatted_ts = _format_timestamp(ts, tz)
+    else:
+        formatted_ts = "N/A"
+
+    # Determine direction icon, neutral without a previous or current estimate
+    prev_est = previous.get("estimate_price_toman") if previous else None
+    if prev_est is None or estimate_mesqal is None:
+        direction_icon = "⚪"
+    elif estimate_mesqal > prev_est:
+        direction_icon = "🟢"
+    elif estimate_mesqal < prev_est:
+        direction_icon = "🔴"
+    else:
+        direction_icon = "⚪"
+
+    return _MESSAGE_TEMPLATE.format_map(
+        {
+            "direction_icon": direction_icon,
+            "buy_mesqal": _format_price(buy_mesqal),
+            "buy_per_gram": _format_price(_per_gram(buy_mesqal)),
+            "sell_mesqal": _format_price(sell_mesqal),
+            "sell_per_gram": _format_price(_per_gram(sell_mesqal)),
+            "timestamp": formatted_ts,
+        }
+    )
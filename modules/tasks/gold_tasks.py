@@ -1,66 +1,139 @@
 import asyncio
+import threading
 from datetime import datetime
+from functools import partial
+from typing import Final, Optional
 from celery import shared_task
+from celery.signals import worker_process_shutdown
 
 from modules.bots import TelegramBot
-from modules.services import GoldService
+from modules.scrapers import ZarbahaScraper
+from modules.services import GoldService, format_price_message
 from modules.configs import get_settings, get_logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and not available on Windows
+    uvloop = None
 
-@shared_task(bind=True, max_retries=3)
-def fetch_and_send(self):
-    logger = get_logger("GoldTask")
-    settings = get_settings()
+logger = get_logger("GoldTask")
 
-    SCHEDULER_TIME_ZONE = settings["SCHEDULER_TIME_ZONE"]
-    now = datetime.now(SCHEDULER_TIME_ZONE)
-    current_time = now.time()
+# Seconds a task waits for its message to be sent on the shared loop
+SEND_TIMEOUT: Final[int] = 30
 
-    SCHEDULER_START_TIME = settings["SCHEDULER_START_TIME"]
-    SCHEDULER_END_TIME = settings["SCHEDULER_END_TIME"]
+# Event loop kept running in a daemon thread for the life of the worker, so
+# the bot's HTTP connections to Telegram stay open between tasks
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
 
-    # Check if within working hours
-    if not (SCHEDULER_START_TIME <= current_time <= SCHEDULER_END_TIME):
-        logger.debug(f"Outside working hours: {current_time}")
-        return "Skipped (outside working hours)"
+# Created on the first task and reused by every later one, so ticks outside
+# working hours never build the service or bot (and close its scraper)
+_price_service: Optional[GoldService] = None
 
-    try:
-        price_service = GoldService()
-        telegram = TelegramBot(
-            token=settings["TELEGRAM_TOKEN"],
-            proxy=settings["TELEGRAM_PROXY_URL"],
-            admin_ids=[settings["ADMIN_CHAT_IDS"]],
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the worker's background event loop, starting it on first use."""
+    global _loop
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="gold-task-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def _get_price_service() -> GoldService:
+    """Return the worker's GoldService and its bot, created on first use."""
+    global _price_service
+
+    if _price_service is None:
+        settings = get_settings()
+        telegram = TelegramBot.instance(
+            token=settings.TELEGRAM_TOKEN,
+            proxy=settings.TELEGRAM_PROXY_URL,
+            admin_ids=settings.ADMIN_CHAT_IDS,
         )
+        _price_service = GoldService(telegram_bot=telegram)
+    return _price_service
 
-        prices = price_service.fetch_data()
 
-        if prices and prices.get("estimate_price_toman"):
-            latest = price_service.get_latest_price()
+@worker_process_shutdown.connect
+def _close_price_service(**kwargs):
+    """
+    Close the service and quit Chrome when the worker process exits.
 
-            if latest:
-                # Previous entry
-                try:
-                    all_entries = price_service.repo.get_all()
-                    prev = all_entries[-2] if len(all_entries) >= 2 else None
-                except:
-                    prev = None
+    Pool processes leave with os._exit(), so the scraper's atexit hook
+    never runs there.
+    """
+    if _price_service is not None:
+        _price_service.close()
+    ZarbahaScraper.cleanup(force=True)
 
-                message = price_service.format_message(latest, previous=prev)
 
-                channel_id = settings["TELEGRAM_CHANNEL_ID"]
-                if not channel_id:
-                    raise ValueError("TELEGRAM_CHANNEL_ID not set")
+@shared_task(bind=True, max_retries=3)
+def fetch_and_send(self):
+    settings = get_settings()
 
-                asyncio.run(telegram.send_channel_message(channel_id, message))
+    SCHEDULER_TIME_ZONE = settings.SCHEDULER_TIME_ZONE
+    now = datetime.now(SCHEDULER_TIME_ZONE)
+    # Minute precision like GoldScheduler, so the tick due at the end time
+    # still runs although it starts a few milliseconds after it
+    current_time = now.time().replace(second=0, microsecond=0)
 
-                logger.info(f"Price update sent to channel {channel_id}")
-            else:
-                logger.warning("No latest price found")
-        else:
-            logger.warning("Invalid price data")
+    SCHEDULER_START_TIME = settings.SCHEDULER_START_TIME
+    SCHEDULER_END_TIME = settings.SCHEDULER_END_TIME
 
+    # Check if within working hours
+    if not (SCHEDULER_START_TIME <= current_time <= SCHEDULER_END_TIME):
+        logger.debug(f"Outside working hours: {current_time}")
+        # Don't keep the browser running until the next working hours
+        if _price_service is not None:
+            _price_service.close_scraper()
+        return "Skipped (outside working hours)"
+
+    channel_id = settings.TELEGRAM_CHANNEL_ID
+    if not channel_id:
+        raise ValueError("TELEGRAM_CHANNEL_ID not set")
+
+    try:
+        price_service = _get_price_service()
+        success, (latest, prev) = price_service.fetch_latest()
     except Exception as e:
         logger.error(f"Task error: {e}")
         raise self.retry(exc=e, countdown=5)
 
+    if not success:
+        logger.warning("Invalid price data")
+        return "OK"
+
+    # A quiet market: don't repeat the last message until it's stale
+    if price_service.is_unchanged(latest):
+        logger.info("Price unchanged since last send, skipping.")
+        return "Skipped (price unchanged)"
+
+    message = format_price_message(latest, prev, tz=SCHEDULER_TIME_ZONE)
+
+    # The entry is stored at this point, so send errors are not retried:
+    # a retry would scrape and store it again. The next tick sends a fresh
+    # message since this one was never marked as sent.
+    future = asyncio.run_coroutine_threadsafe(
+        price_service.telegram_bot.send_channel_message(
+            channel_id,
+            message,
+            # The repository write blocks, keep it off the send loop
+            on_sent=partial(asyncio.to_thread, price_service.mark_sent, latest),
+        ),
+        _get_loop(),
+    )
+    try:
+        future.result(timeout=SEND_TIMEOUT)
+    except TimeoutError:
+        # Stop the retries still running on the loop, or they'd deliver late
+        future.cancel()
+        logger.error(f"Sending to channel {channel_id} timed out")
+        return "Send timed out"
+
+    # The bot logs whether the message was delivered
     return "OK"
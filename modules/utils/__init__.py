@@ -1 +1,2 @@
 from .parse_time import parse_env_time
+from .parse_price import parse_price
@@ -0,0 +1,24 @@
+import re
+
+# One table maps Persian and Arabic-Indic digits to ASCII and deletes the
+# separators seen in rendered prices: ASCII/Arabic thousands and decimal marks,
+# spaces and the zero-width/bidi marks used around Persian text
+_NORMALIZE = str.maketrans(
+    "۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩",
+    "01234567890123456789",
+    ",.٫٬  ‌‏‫‬",
+)
+
+_NON_DIGITS = re.compile(r"[^\d]")
+
+
+def parse_price(value: str) -> int:
+    """Convert a rendered price like '12,345,000' to int. Raises ValueError if empty."""
+    if value.isascii() and value.isdigit():
+        return int(value)
+
+    number = value.translate(_NORMALIZE)
+    if not number.isdigit():
+        # Unexpected characters (e.g. a currency label), fall back to the regex
+        number = _NON_DIGITS.sub("", number)
+    return int(number)